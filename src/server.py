@@ -7,10 +7,15 @@ Exposes Slack tools via Dedalus MCP framework.
 Uses static SLACK_BOT_TOKEN from environment for authentication.
 """
 
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
 from dedalus_mcp import MCPServer
 from dedalus_mcp.server import TransportSecuritySettings
+from dedalus_mcp.utils.logger import DedalusMCPHandler
 
-from slack import slack_tools
+from slack import close_client, slack_tools
 from smoke import smoke_tools
 
 
@@ -24,8 +29,44 @@ def create_server() -> MCPServer:
     )
 
 
+class _QueuedDedalusHandler(QueueHandler, DedalusMCPHandler):
+    """QueueHandler that dedalus_mcp recognizes as its own root handler.
+
+    dedalus_mcp's get_logger() reinstalls a stderr handler whenever the root
+    logger has no DedalusMCPHandler, which would undo the queued setup.
+    """
+
+    def __init__(self, log_queue: queue.SimpleQueue[logging.LogRecord]) -> None:
+        QueueHandler.__init__(self, log_queue)
+        self.stream = None  # Nothing to flush; the listener's handlers own the streams
+
+
+def _start_log_listener() -> QueueListener:
+    """Move stream log output off the event loop.
+
+    Root stream handlers are replaced by a QueueHandler and run in a listener
+    thread, so logging never blocks on stderr. Other handlers, such as the MCP
+    log notification handler, stay in place.
+    """
+    root = logging.getLogger()
+    stream_handlers = [handler for handler in root.handlers if isinstance(handler, logging.StreamHandler)]
+    for handler in stream_handlers:
+        root.removeHandler(handler)
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root.addHandler(_QueuedDedalusHandler(log_queue))
+    listener = QueueListener(log_queue, *stream_handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
 async def main() -> None:
     """Start MCP server."""
     server = create_server()
     server.collect(*smoke_tools, *slack_tools)
-    await server.serve(port=8080)
+    log_listener = _start_log_listener()
+    try:
+        await server.serve(port=8080)
+    finally:
+        await close_client()
+        log_listener.stop()
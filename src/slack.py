@@ -41,12 +41,21 @@ reminders.*:           reminders:read, reminders:write
 bookmarks.list:        bookmarks:read
 """
 
-import json
+import asyncio
+import logging
 import os
+import random
+import re
+import ssl
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
+import certifi
 import httpx
+import orjson
 from mcp.types import TextContent, Tool
 
 from dedalus_mcp.types import ToolAnnotations
@@ -57,14 +66,195 @@ from dedalus_mcp import tool
 # Configuration
 # -----------------------------------------------------------------------------
 
+logger = logging.getLogger(__name__)
+
 SLACK_API_BASE = "https://slack.com/api"
 ENV_FILE = Path(__file__).parent.parent / ".env"
 
-# Token state (mutable for refresh)
-_token_state: dict[str, str] = {
-    "access_token": os.getenv("SLACK_TOKEN", "") or os.getenv("SLACK_BOT_TOKEN", "") or os.getenv("SLACK_USER_TOKEN", ""),
-    "refresh_token": os.getenv("SLACK_REFRESH_TOKEN", ""),
+# .env lines holding tokens, rewritten in place on refresh
+_ACCESS_TOKEN_LINE = re.compile(r"^(?:SLACK_TOKEN|SLACK_BOT_TOKEN|SLACK_USER_TOKEN)=.*$\n?", re.MULTILINE)
+_REFRESH_TOKEN_LINE = re.compile(r"^SLACK_REFRESH_TOKEN=.*$", re.MULTILINE)
+
+# Tool output is compact JSON; set SLACK_MCP_PRETTY_JSON=1 to indent it for debugging
+_JSON_OPTIONS = orjson.OPT_INDENT_2 if os.getenv("SLACK_MCP_PRETTY_JSON") == "1" else 0
+
+# CA bundle is parsed once at import instead of for every client
+_SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
+
+# Shared HTTP client (created lazily, closed on server shutdown)
+_client: httpx.AsyncClient | None = None
+
+# Slack rate limit tiers in requests per minute.
+# Ref: https://api.slack.com/apis/rate-limits
+_TIER_RATES: dict[int, int] = {1: 1, 2: 20, 3: 50, 4: 100}
+_DEFAULT_TIER = 3
+_METHOD_TIERS: dict[str, int] = {
+    "conversations.list": 2,
+    "conversations.info": 3,
+    "conversations.history": 3,
+    "conversations.replies": 3,
+    "conversations.members": 4,
+    "conversations.join": 3,
+    "conversations.leave": 3,
+    "conversations.open": 3,
+    "chat.update": 3,
+    "chat.delete": 3,
+    "reactions.add": 3,
+    "reactions.remove": 2,
+    "search.messages": 2,
+    "users.list": 2,
+    "users.info": 4,
+    "users.lookupByEmail": 3,
+    "auth.test": 4,
+    "team.info": 3,
+    "bookmarks.list": 3,
+    "pins.list": 2,
+    "pins.add": 2,
+    "pins.remove": 2,
+    "reminders.list": 2,
+    "reminders.add": 2,
+    "reminders.delete": 2,
+    "files.list": 3,
+    "files.info": 4,
+}
+# chat.postMessage is "special" tier: about one message per second per channel,
+# enforced by the channel write queues. This caps the workspace-wide rate.
+_METHOD_RATES: dict[str, int] = {"chat.postMessage": 300}
+_BUCKET_BURST = 3
+_MAX_RATE_LIMIT_RETRIES = 3
+
+# Transient failures (network errors, 5xx) are retried with exponential backoff
+_MAX_RETRIES = 4
+_RETRY_BASE_DELAY = 0.5
+# Errors raised before a request reaches Slack, so even writes can be retried
+_CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+# Caps concurrent requests to slack.com, matching the client's connection pool
+_host_semaphore = asyncio.Semaphore(64)
+
+# Per-method token buckets: endpoint -> (tokens, last refill time)
+_buckets: dict[str, tuple[float, float]] = {}
+_bucket_lock = asyncio.Lock()
+
+# Methods that only read data; identical concurrent calls to these are coalesced
+# and transient failures are retried. Must match the endpoints of the readOnlyHint
+# tools (checked by tests/test_slack.py).
+_READ_ONLY_METHODS: frozenset[str] = frozenset({
+    "conversations.list",
+    "conversations.info",
+    "conversations.history",
+    "conversations.replies",
+    "conversations.members",
+    "search.messages",
+    "users.list",
+    "users.info",
+    "users.lookupByEmail",
+    "auth.test",
+    "team.info",
+    "bookmarks.list",
+    "pins.list",
+    "reminders.list",
+    "files.list",
+    "files.info",
+})
+
+# In-flight read requests: (method, endpoint, params) -> pending request
+_inflight: dict[tuple[Any, ...], asyncio.Future[dict[str, Any]]] = {}
+
+# Cache lifetimes in seconds for read-only methods whose data rarely changes
+_CACHE_TTLS: dict[str, float] = {
+    "users.info": 3600,
+    "users.lookupByEmail": 3600,
+    "team.info": 86400,
+    "conversations.info": 300,
+    "bookmarks.list": 60,
+    "pins.list": 60,
 }
+# Cached methods made stale by a write method
+_CACHE_INVALIDATIONS: dict[str, tuple[str, ...]] = {
+    "conversations.join": ("conversations.info",),
+    "conversations.leave": ("conversations.info",),
+    "pins.add": ("pins.list",),
+    "pins.remove": ("pins.list",),
+}
+
+# Cached read responses: (method, endpoint, params) -> (fetch time, decoded body),
+# least recently used first and capped at _CACHE_MAX_ENTRIES
+_CACHE_MAX_ENTRIES = 2048
+_cache: OrderedDict[tuple[Any, ...], tuple[float, dict[str, Any]]] = OrderedDict()
+
+# Items per page requested by the paginating tools (Slack's recommended maximum)
+_PAGE_SIZE = 200
+
+# Writes to one channel are sent in order, at most one per interval (seconds)
+_CHANNEL_WRITE_INTERVAL = 1.0
+_channel_queues: dict[str, asyncio.Queue[tuple[str, dict[str, Any], asyncio.Future[dict[str, Any]]]]] = {}
+_channel_workers: set[asyncio.Task[None]] = set()
+
+# Token state (loaded from env at import, reassigned on refresh)
+_ACCESS_TOKEN = ""
+_REFRESH_TOKEN = ""
+# Request headers for the current access token, rebuilt whenever it changes
+_POST_HEADERS: dict[str, str] = {}
+_GET_HEADERS: dict[str, str] = {}
+# Only one token rotation runs at a time; .env writes are serialized across threads
+_refresh_lock = asyncio.Lock()
+_env_file_lock = threading.Lock()
+
+# -----------------------------------------------------------------------------
+# HTTP Client
+# -----------------------------------------------------------------------------
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use.
+
+    Reusing one client keeps connections alive across tool calls, so only the
+    first request to slack.com pays for the TCP and TLS handshake. HTTP/2 lets
+    concurrent tool calls share that connection instead of opening new ones.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=SLACK_API_BASE,
+            http2=True,
+            verify=_SSL_CONTEXT,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client, if one was created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+# -----------------------------------------------------------------------------
+# Rate Limiting
+# -----------------------------------------------------------------------------
+
+
+async def _acquire(endpoint: str) -> None:
+    """Wait until the token bucket for a Slack method allows another call."""
+    per_minute = _METHOD_RATES.get(endpoint) or _TIER_RATES[_METHOD_TIERS.get(endpoint, _DEFAULT_TIER)]
+    rate = per_minute / 60
+    burst = min(_BUCKET_BURST, per_minute)
+
+    while True:
+        async with _bucket_lock:
+            now = time.monotonic()
+            tokens, last = _buckets.get(endpoint, (burst, now))
+            tokens = min(burst, tokens + (now - last) * rate)
+            if tokens >= 1:
+                _buckets[endpoint] = (tokens - 1, now)
+                return
+            _buckets[endpoint] = (tokens, now)
+            wait = (1 - tokens) / rate
+        await asyncio.sleep(wait)
+
 
 # -----------------------------------------------------------------------------
 # Token Management
@@ -89,89 +279,117 @@ def _get_token_type(token: str) -> str:
         return "unknown"
 
 
+def _set_tokens(access_token: str, refresh_token: str) -> None:
+    """Store tokens and rebuild the request headers that carry the access token."""
+    global _ACCESS_TOKEN, _REFRESH_TOKEN, _POST_HEADERS, _GET_HEADERS
+    _ACCESS_TOKEN = access_token
+    _REFRESH_TOKEN = refresh_token
+    _GET_HEADERS = {"Authorization": f"Bearer {access_token}"}
+    _POST_HEADERS = {**_GET_HEADERS, "Content-Type": "application/json; charset=utf-8"}
+
+
 def _load_token_from_env() -> None:
     """Reload tokens from environment. Checks multiple env var names for flexibility."""
-    _token_state["access_token"] = (
+    _set_tokens(
         os.getenv("SLACK_TOKEN", "") or
         os.getenv("SLACK_BOT_TOKEN", "") or
-        os.getenv("SLACK_USER_TOKEN", "")
+        os.getenv("SLACK_USER_TOKEN", ""),
+        os.getenv("SLACK_REFRESH_TOKEN", ""),
     )
-    _token_state["refresh_token"] = os.getenv("SLACK_REFRESH_TOKEN", "")
 
 
-def _save_tokens_to_env(access_token: str, refresh_token: str) -> None:
-    """Save new tokens to .env file."""
-    _token_state["access_token"] = access_token
-    _token_state["refresh_token"] = refresh_token
+_load_token_from_env()
+
+
+def _write_tokens_to_env(access_token: str, refresh_token: str) -> None:
+    """Write new tokens to .env file (blocking).
 
-    if ENV_FILE.exists():
+    The new content goes to a temp file that replaces .env, so a reader never
+    sees a half-written file.
+    """
+    with _env_file_lock:
+        if not ENV_FILE.exists():
+            return
         content = ENV_FILE.read_text()
-        lines = content.splitlines()
-        new_lines = []
-        found_access = False
-        found_refresh = False
-
-        for line in lines:
-            if line.startswith(("SLACK_TOKEN=", "SLACK_BOT_TOKEN=", "SLACK_USER_TOKEN=")):
-                if not found_access:
-                    new_lines.append(f"SLACK_TOKEN={access_token}")
-                    found_access = True
-                # Skip duplicate token lines
-            elif line.startswith("SLACK_REFRESH_TOKEN="):
-                new_lines.append(f"SLACK_REFRESH_TOKEN={refresh_token}")
-                found_refresh = True
-            else:
-                new_lines.append(line)
 
+        # First access token line becomes SLACK_TOKEN, duplicates are dropped
+        access_lines = iter([f"SLACK_TOKEN={access_token}\n"])
+        content, found_access = _ACCESS_TOKEN_LINE.subn(lambda _: next(access_lines, ""), content)
+        content, found_refresh = _REFRESH_TOKEN_LINE.subn(lambda _: f"SLACK_REFRESH_TOKEN={refresh_token}", content)
+
+        if content and not content.endswith("\n"):
+            content += "\n"
         if not found_access:
-            new_lines.append(f"SLACK_TOKEN={access_token}")
+            content += f"SLACK_TOKEN={access_token}\n"
         if not found_refresh and refresh_token:
-            new_lines.append(f"SLACK_REFRESH_TOKEN={refresh_token}")
+            content += f"SLACK_REFRESH_TOKEN={refresh_token}\n"
+
+        tmp_file = ENV_FILE.with_name(ENV_FILE.name + ".tmp")
+        tmp_file.write_text(content)
+        os.replace(tmp_file, ENV_FILE)
 
-        ENV_FILE.write_text("\n".join(new_lines) + "\n")
 
+async def _save_tokens_to_env(access_token: str, refresh_token: str) -> None:
+    """Save new tokens to state and .env file.
 
-async def _refresh_token() -> bool:
-    """Refresh the access token using the refresh token (for xoxe.* tokens)."""
-    refresh_token = _token_state["refresh_token"]
+    The file is written in a worker thread so the event loop keeps serving
+    other tool calls during the refresh.
+    """
+    _set_tokens(access_token, refresh_token)
+    await asyncio.to_thread(_write_tokens_to_env, access_token, refresh_token)
+
+
+async def _refresh_token(expired_token: str) -> bool:
+    """Refresh the access token using the refresh token (for xoxe.* tokens).
+
+    Many requests can fail with token_expired at once. Refreshes are serialized,
+    and a caller whose expired token was already replaced just retries with the
+    new one instead of rotating again.
+    """
+    async with _refresh_lock:
+        if expired_token != _ACCESS_TOKEN:
+            return True
+        return await _rotate_token()
+
+
+async def _rotate_token() -> bool:
+    """Exchange the refresh token for a new token pair and save it."""
+    refresh_token = _REFRESH_TOKEN
 
     if not refresh_token:
-        print("No refresh token available")
+        logger.warning("No refresh token available")
         return False
 
-    async with httpx.AsyncClient() as client:
-        resp = await client.post(
-            f"{SLACK_API_BASE}/tooling.tokens.rotate",
-            data={
-                "refresh_token": refresh_token,
-            },
-        )
-        data = resp.json()
-
-        if data.get("ok"):
-            new_access = data.get("token", "")
-            new_refresh = data.get("refresh_token", "")
-            if new_access:
-                _save_tokens_to_env(new_access, new_refresh)
-                print("Token refreshed successfully")
-                return True
-        else:
-            print(f"Token refresh failed: {data.get('error', 'unknown error')}")
+    resp = await _get_client().post(
+        "tooling.tokens.rotate",
+        data={
+            "refresh_token": refresh_token,
+        },
+    )
+    data = orjson.loads(resp.content)
+
+    if data.get("ok"):
+        new_access = data.get("token", "")
+        new_refresh = data.get("refresh_token", "")
+        if new_access:
+            await _save_tokens_to_env(new_access, new_refresh)
+            logger.info("Token refreshed successfully")
+            return True
+    else:
+        logger.warning("Token refresh failed: %s", data.get("error", "unknown error"))
 
     return False
 
 
 def _get_token() -> str:
     """Get Slack token from state."""
-    token = _token_state["access_token"]
-    if not token:
+    if not _ACCESS_TOKEN:
         _load_token_from_env()
-        token = _token_state["access_token"]
-    if not token:
-        raise ValueError(
-            "Slack token not found. Set one of: SLACK_TOKEN, SLACK_BOT_TOKEN, or SLACK_USER_TOKEN"
-        )
-    return token
+        if not _ACCESS_TOKEN:
+            raise ValueError(
+                "Slack token not found. Set one of: SLACK_TOKEN, SLACK_BOT_TOKEN, or SLACK_USER_TOKEN"
+            )
+    return _ACCESS_TOKEN
 
 
 def _is_user_token() -> bool:
@@ -181,51 +399,218 @@ def _is_user_token() -> bool:
     return token_type in ("user", "user_rotatable")
 
 
-async def _post(endpoint: str, params: dict[str, Any] | None = None, retry_on_auth_fail: bool = True) -> SlackResult:
-    """Make a POST request to Slack API with auto token refresh."""
+def _build_request(method: str, endpoint: str, params: dict[str, Any] | None) -> httpx.Request:
+    """Build a Slack API request. POST sends params as JSON, GET as query parameters."""
+    if method == "POST":
+        return _get_client().build_request("POST", endpoint, headers=_POST_HEADERS, json=params or {})
+    return _get_client().build_request("GET", endpoint, headers=_GET_HEADERS, params=params or {})
+
+
+async def _send(method: str, endpoint: str, params: dict[str, Any] | None) -> dict[str, Any]:
+    """Send a request to Slack API and return the decoded body.
+
+    Each attempt waits for the method's rate limit first. Responses with HTTP
+    429 are retried after the delay given in Retry-After. Read-only methods are
+    also retried on network errors and 5xx responses with exponential backoff.
+    Writes are only retried when the connection failed, so a message is never
+    posted twice. Responses that get retried are closed without reading the body.
+    """
+    retry_all = endpoint in _READ_ONLY_METHODS
+    attempt = 0
+    rate_limited = 0
+    while True:
+        await _acquire(endpoint)
+        _get_token()  # Loads the token (and headers) from env, or raises if unset
+        delay = _RETRY_BASE_DELAY * 2**attempt + random.random() * 0.1
+        try:
+            async with _host_semaphore:
+                resp = await _get_client().send(_build_request(method, endpoint, params), stream=True)
+                try:
+                    if resp.status_code == 429 and rate_limited < _MAX_RATE_LIMIT_RETRIES:
+                        rate_limited += 1
+                        delay = float(resp.headers.get("Retry-After", "1"))
+                    elif resp.status_code < 500 or not retry_all or attempt >= _MAX_RETRIES:
+                        return orjson.loads(await resp.aread())
+                    else:
+                        attempt += 1
+                finally:
+                    await resp.aclose()
+        except httpx.TransportError as e:
+            if attempt >= _MAX_RETRIES or not (retry_all or isinstance(e, _CONNECT_ERRORS)):
+                raise
+            attempt += 1
+        await asyncio.sleep(delay)
+
+
+async def _fetch(
+    method: str,
+    endpoint: str,
+    params: dict[str, Any] | None = None,
+    retry_on_auth_fail: bool = True,
+) -> dict[str, Any]:
+    """Send a request to Slack API with auto token refresh and return the decoded body."""
     token = _get_token()
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json; charset=utf-8",
-    }
-
-    async with httpx.AsyncClient() as client:
-        resp = await client.post(
-            f"{SLACK_API_BASE}/{endpoint}",
-            headers=headers,
-            json=params or {},
-        )
-        data = resp.json()
-
-        # Check for token expiration (rotatable tokens only)
-        if not data.get("ok") and data.get("error") == "token_expired" and retry_on_auth_fail:
-            if await _refresh_token():
-                return await _post(endpoint, params, retry_on_auth_fail=False)
-
-        return [TextContent(type="text", text=json.dumps(data, indent=2))]
+    data = await _send(method, endpoint, params)
+
+    # Check for token expiration (rotatable tokens only)
+    if not data.get("ok") and data.get("error") == "token_expired" and retry_on_auth_fail:
+        if await _refresh_token(token):
+            return await _fetch(method, endpoint, params, retry_on_auth_fail=False)
+
+    return data
+
+
+def _cache_invalidate(endpoint_prefix: str) -> None:
+    """Drop cached responses for methods starting with the given prefix."""
+    for key in [key for key in _cache if key[1].startswith(endpoint_prefix)]:
+        del _cache[key]
+
+
+async def _request(method: str, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Send a request to Slack API, sharing one in-flight call between identical reads.
+
+    Concurrent calls to a read-only method with the same params await the same
+    request instead of each hitting the network. Writes are never coalesced.
+    Successful responses for methods in _CACHE_TTLS are served from cache until
+    they expire or a related write invalidates them. Expired entries are dropped
+    when looked up, and the least recently used entry is evicted once the cache
+    holds _CACHE_MAX_ENTRIES.
+    """
+    if endpoint not in _READ_ONLY_METHODS:
+        data = await _fetch(method, endpoint, params)
+        for prefix in _CACHE_INVALIDATIONS.get(endpoint, ()):
+            _cache_invalidate(prefix)
+        return data
+
+    key = (method, endpoint, tuple(sorted((params or {}).items())))
+    ttl = _CACHE_TTLS.get(endpoint)
+    if ttl is not None:
+        cached = _cache.get(key)
+        if cached is not None:
+            if time.monotonic() - cached[0] < ttl:
+                _cache.move_to_end(key)
+                return cached[1]
+            del _cache[key]
+
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch(method, endpoint, params))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shield so one caller being cancelled does not cancel the shared request
+    data = await asyncio.shield(task)
+
+    if ttl is not None and data.get("ok"):
+        _cache[key] = (time.monotonic(), data)
+        _cache.move_to_end(key)
+        if len(_cache) > _CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+    return data
+
+
+def _to_result(data: dict[str, Any]) -> SlackResult:
+    """Serialize a decoded Slack response as tool output.
+
+    Uses model_construct to skip pydantic validation; the fields are always a
+    literal type and a str.
+    """
+    return [TextContent.model_construct(type="text", text=orjson.dumps(data, option=_JSON_OPTIONS).decode())]
+
+
+async def _post(endpoint: str, params: dict[str, Any] | None = None) -> SlackResult:
+    """Make a POST request to Slack API with auto token refresh."""
+    return _to_result(await _request("POST", endpoint, params))
 
 
-async def _get(endpoint: str, params: dict[str, Any] | None = None, retry_on_auth_fail: bool = True) -> SlackResult:
+async def _get(endpoint: str, params: dict[str, Any] | None = None) -> SlackResult:
     """Make a GET request to Slack API with auto token refresh."""
-    token = _get_token()
-    headers = {
-        "Authorization": f"Bearer {token}",
-    }
+    return _to_result(await _request("GET", endpoint, params))
 
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(
-            f"{SLACK_API_BASE}/{endpoint}",
-            headers=headers,
-            params=params or {},
-        )
-        data = resp.json()
-
-        # Check for token expiration (rotatable tokens only)
-        if not data.get("ok") and data.get("error") == "token_expired" and retry_on_auth_fail:
-            if await _refresh_token():
-                return await _get(endpoint, params, retry_on_auth_fail=False)
 
-        return [TextContent(type="text", text=json.dumps(data, indent=2))]
+async def _channel_worker(
+    channel: str,
+    queue: asyncio.Queue[tuple[str, dict[str, Any], asyncio.Future[dict[str, Any]]]],
+) -> None:
+    """Send queued writes for one channel in order, spaced by the write interval.
+
+    Exits once the queue stays empty for a full interval. A caller that is
+    cancelled while its write is in flight does not stop the worker; the write
+    still completes and its result is dropped.
+    """
+    try:
+        while not queue.empty():
+            endpoint, params, future = queue.get_nowait()
+            if future.done():
+                continue
+            try:
+                data = await _request("POST", endpoint, params)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(data)
+            await asyncio.sleep(_CHANNEL_WRITE_INTERVAL)
+    finally:
+        if _channel_queues.get(channel) is queue:
+            del _channel_queues[channel]
+
+
+async def _post_to_channel(endpoint: str, params: dict[str, Any]) -> SlackResult:
+    """Make a POST request queued behind earlier writes to the same channel.
+
+    Slack limits posting per channel, so writes to one channel are serialized
+    while writes to different channels still run concurrently.
+    """
+    channel = params["channel"]
+    queue = _channel_queues.get(channel)
+    if queue is None:
+        queue = _channel_queues[channel] = asyncio.Queue()
+        worker = asyncio.create_task(_channel_worker(channel, queue))
+        _channel_workers.add(worker)
+        worker.add_done_callback(_channel_workers.discard)
+
+    future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+    queue.put_nowait((endpoint, params, future))
+    return _to_result(await future)
+
+
+def _optional(**params: str) -> dict[str, str]:
+    """Return the optional string arguments that were set (non-empty).
+
+    Only for arguments that are left out of the request when empty; required
+    and always-sent arguments go in the params dict directly.
+    """
+    return {key: value for key, value in params.items() if value}
+
+
+async def _paginate(
+    endpoint: str,
+    params: dict[str, Any],
+    items_key: str,
+    max_pages: int = 20,
+) -> dict[str, Any]:
+    """Follow response_metadata.next_cursor and merge the items of every page.
+
+    Requests _PAGE_SIZE items per page unless params set a limit. Fetches at
+    least one page and stops after max_pages; the returned next_cursor is
+    non-empty if more remain. If a page fails, Slack's error is returned along
+    with the items from the pages before it, and next_cursor is the cursor of
+    the failed page so the caller can resume from there.
+    """
+    params = {"limit": _PAGE_SIZE, **params}
+    items: list[Any] = []
+    cursor = ""
+    for _ in range(max(1, max_pages)):
+        data = await _request("POST", endpoint, params)
+        if not data.get("ok"):
+            return {**data, items_key: items, "response_metadata": {"next_cursor": cursor}}
+        items.extend(data.get(items_key, []))
+        cursor = data.get("response_metadata", {}).get("next_cursor", "")
+        if not cursor:
+            break
+        params["cursor"] = cursor
+    return {"ok": True, items_key: items, "response_metadata": {"next_cursor": cursor}}
 
 
 # -----------------------------------------------------------------------------
@@ -245,14 +630,25 @@ async def slack_list_conversations(
     exclude_archived: bool = True,
 ) -> SlackResult:
     """List conversations the user is a member of."""
-    params: dict[str, Any] = {
-        "types": types,
-        "limit": limit,
-        "exclude_archived": exclude_archived,
-    }
-    if cursor:
-        params["cursor"] = cursor
-    return await _post("conversations.list", params)
+    return await _post(
+        "conversations.list",
+        {"types": types, "limit": limit, "exclude_archived": exclude_archived, **_optional(cursor=cursor)},
+    )
+
+
+@tool(
+    description="List all conversations the user is a member of, following pagination server-side. Use types parameter to filter: public_channel, private_channel, mpim (group DMs), im (DMs).",
+    tags=["channel", "read"],
+    annotations=ToolAnnotations(readOnlyHint=True),
+)
+async def slack_list_conversations_all(
+    types: str = "public_channel,private_channel",
+    exclude_archived: bool = True,
+    max_pages: int = 20,
+) -> SlackResult:
+    """List conversations across all pages."""
+    params = {"types": types, "exclude_archived": exclude_archived}
+    return _to_result(await _paginate("conversations.list", params, "channels", max_pages))
 
 
 @tool(
@@ -286,20 +682,39 @@ async def slack_conversations_history(
     inclusive: bool = True,
 ) -> SlackResult:
     """Fetch conversation history."""
-    params: dict[str, Any] = {
+    params = {
         "channel": channel,
         "limit": limit,
         "inclusive": inclusive,
+        **_optional(cursor=cursor, oldest=oldest, latest=latest),
     }
-    if cursor:
-        params["cursor"] = cursor
-    if oldest:
-        params["oldest"] = oldest
-    if latest:
-        params["latest"] = latest
     return await _post("conversations.history", params)
 
 
+@tool(
+    description="Fetch message history from several conversations at once, following pagination server-side. Pass channel IDs comma-separated. Results are keyed by channel ID.",
+    tags=["message", "read"],
+    annotations=ToolAnnotations(readOnlyHint=True),
+)
+async def slack_conversations_history_all(
+    channels: str,
+    oldest: str = "",
+    latest: str = "",
+    max_pages: int = 5,
+) -> SlackResult:
+    """Fetch full history for multiple conversations in parallel."""
+    params = {"inclusive": True, **_optional(oldest=oldest, latest=latest)}
+    channel_ids = [channel.strip() for channel in channels.split(",") if channel.strip()]
+    semaphore = asyncio.Semaphore(8)
+
+    async def fetch(channel: str) -> dict[str, Any]:
+        async with semaphore:
+            return await _paginate("conversations.history", {**params, "channel": channel}, "messages", max_pages)
+
+    results = await asyncio.gather(*(fetch(channel) for channel in channel_ids))
+    return _to_result({"ok": True, "channels": dict(zip(channel_ids, results, strict=True))})
+
+
 @tool(
     description="Get replies (thread messages) for a specific message in a conversation.",
     tags=["message", "thread", "read"],
@@ -315,18 +730,13 @@ async def slack_conversations_replies(
     inclusive: bool = True,
 ) -> SlackResult:
     """Get thread replies for a message."""
-    params: dict[str, Any] = {
+    params = {
         "channel": channel,
         "ts": ts,
         "limit": limit,
         "inclusive": inclusive,
+        **_optional(cursor=cursor, oldest=oldest, latest=latest),
     }
-    if cursor:
-        params["cursor"] = cursor
-    if oldest:
-        params["oldest"] = oldest
-    if latest:
-        params["latest"] = latest
     return await _post("conversations.replies", params)
 
 
@@ -341,13 +751,7 @@ async def slack_conversations_members(
     cursor: str = "",
 ) -> SlackResult:
     """List members of a conversation."""
-    params: dict[str, Any] = {
-        "channel": channel,
-        "limit": limit,
-    }
-    if cursor:
-        params["cursor"] = cursor
-    return await _post("conversations.members", params)
+    return await _post("conversations.members", {"channel": channel, "limit": limit, **_optional(cursor=cursor)})
 
 
 @tool(
@@ -381,12 +785,7 @@ async def slack_conversations_open(
     return_im: bool = True,
 ) -> SlackResult:
     """Open a DM or MPIM. Provide either users (comma-separated) or channel ID."""
-    params: dict[str, Any] = {"return_im": return_im}
-    if users:
-        params["users"] = users
-    if channel:
-        params["channel"] = channel
-    return await _post("conversations.open", params)
+    return await _post("conversations.open", {"return_im": return_im, **_optional(users=users, channel=channel)})
 
 
 # -----------------------------------------------------------------------------
@@ -417,7 +816,7 @@ async def slack_chat_post_message(
     if thread_ts:
         params["thread_ts"] = thread_ts
         params["reply_broadcast"] = reply_broadcast
-    return await _post("chat.postMessage", params)
+    return await _post_to_channel("chat.postMessage", params)
 
 
 @tool(
@@ -460,7 +859,7 @@ async def slack_reactions_add(
     name: str,
 ) -> SlackResult:
     """Add a reaction to a message. Name is the emoji name without colons (e.g., 'thumbsup')."""
-    return await _post("reactions.add", {"channel": channel, "timestamp": timestamp, "name": name})
+    return await _post_to_channel("reactions.add", {"channel": channel, "timestamp": timestamp, "name": name})
 
 
 @tool(
@@ -495,14 +894,13 @@ async def slack_search_messages(
     sort_dir: str = "desc",
 ) -> SlackResult:
     """Search for messages."""
-    params: dict[str, Any] = {
+    params = {
         "query": query,
         "count": count,
         "sort": sort,
         "sort_dir": sort_dir,
+        **_optional(cursor=cursor),
     }
-    if cursor:
-        params["cursor"] = cursor
     return await _post("search.messages", params)
 
 
@@ -522,13 +920,21 @@ async def slack_users_list(
     include_locale: bool = False,
 ) -> SlackResult:
     """List users in the workspace."""
-    params: dict[str, Any] = {
-        "limit": limit,
-        "include_locale": include_locale,
-    }
-    if cursor:
-        params["cursor"] = cursor
-    return await _post("users.list", params)
+    return await _post("users.list", {"limit": limit, "include_locale": include_locale, **_optional(cursor=cursor)})
+
+
+@tool(
+    description="List all users in the workspace, following pagination server-side.",
+    tags=["user", "read"],
+    annotations=ToolAnnotations(readOnlyHint=True),
+)
+async def slack_users_list_all(
+    include_locale: bool = False,
+    max_pages: int = 20,
+) -> SlackResult:
+    """List users across all pages."""
+    params = {"include_locale": include_locale}
+    return _to_result(await _paginate("users.list", params, "members", max_pages))
 
 
 @tool(
@@ -613,7 +1019,7 @@ async def slack_pins_list(channel: str) -> SlackResult:
 )
 async def slack_pins_add(channel: str, timestamp: str) -> SlackResult:
     """Pin a message to a channel."""
-    return await _post("pins.add", {"channel": channel, "timestamp": timestamp})
+    return await _post_to_channel("pins.add", {"channel": channel, "timestamp": timestamp})
 
 
 @tool(
@@ -652,13 +1058,7 @@ async def slack_reminders_add(
     user: str = "",
 ) -> SlackResult:
     """Create a reminder."""
-    params: dict[str, Any] = {
-        "text": text,
-        "time": time,
-    }
-    if user:
-        params["user"] = user
-    return await _post("reminders.add", params)
+    return await _post("reminders.add", {"text": text, "time": time, **_optional(user=user)})
 
 
 @tool(
@@ -689,17 +1089,10 @@ async def slack_files_list(
     page: int = 1,
 ) -> SlackResult:
     """List files. Types can be: all, spaces, snippets, images, gdocs, zips, pdfs."""
-    params: dict[str, Any] = {
-        "count": count,
-        "page": page,
-    }
-    if channel:
-        params["channel"] = channel
-    if user:
-        params["user"] = user
-    if types:
-        params["types"] = types
-    return await _post("files.list", params)
+    return await _post(
+        "files.list",
+        {"count": count, "page": page, **_optional(channel=channel, user=user, types=types)},
+    )
 
 
 @tool(
@@ -719,8 +1112,10 @@ async def slack_files_info(file: str) -> SlackResult:
 slack_tools: list[Tool] = [
     # Conversations
     slack_list_conversations,
+    slack_list_conversations_all,
     slack_get_conversation_info,
     slack_conversations_history,
+    slack_conversations_history_all,
     slack_conversations_replies,
     slack_conversations_members,
     slack_conversations_join,
@@ -736,6 +1131,7 @@ slack_tools: list[Tool] = [
     slack_search_messages,
     # Users
     slack_users_list,
+    slack_users_list_all,
     slack_users_info,
     slack_users_lookup_by_email,
     slack_auth_test,
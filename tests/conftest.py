@@ -0,0 +1,54 @@
+# Copyright (c) 2026 Dedalus Labs, Inc. and its contributors
+# SPDX-License-Identifier: MIT
+
+"""Shared fixtures for slack-mcp tests."""
+
+import asyncio
+import os
+import sys
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from pathlib import Path
+
+import httpx
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+os.environ.setdefault("SLACK_TOKEN", "xoxb-test")
+
+import slack  # noqa: E402
+
+
+class FakeSlack:
+    """Mock Slack API: records called methods and answers with the test's handler."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.handler: Callable[[httpx.Request], Awaitable[httpx.Response]] | None = None
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append(request.url.path.rsplit("/", 1)[-1])
+        assert self.handler is not None, "test did not set a handler"
+        return await self.handler(request)
+
+
+@pytest.fixture
+async def fake_slack(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[FakeSlack]:
+    """Route slack.py requests to a FakeSlack, with fresh module state per test."""
+    fake = FakeSlack()
+    monkeypatch.setattr(slack, "_cache", OrderedDict())
+    monkeypatch.setattr(slack, "_inflight", {})
+    monkeypatch.setattr(slack, "_buckets", {})
+    monkeypatch.setattr(slack, "_bucket_lock", asyncio.Lock())
+    monkeypatch.setattr(slack, "_host_semaphore", asyncio.Semaphore(64))
+    monkeypatch.setattr(slack, "_channel_queues", {})
+    monkeypatch.setattr(slack, "_refresh_lock", asyncio.Lock())
+    for name in ("_ACCESS_TOKEN", "_REFRESH_TOKEN", "_POST_HEADERS", "_GET_HEADERS"):
+        monkeypatch.setattr(slack, name, getattr(slack, name))
+    monkeypatch.setattr(slack, "_RETRY_BASE_DELAY", 0)
+    monkeypatch.setattr(slack, "_CHANNEL_WRITE_INTERVAL", 0.01)
+
+    client = httpx.AsyncClient(base_url=slack.SLACK_API_BASE, transport=httpx.MockTransport(fake))
+    monkeypatch.setattr(slack, "_client", client)
+    yield fake
+    await client.aclose()
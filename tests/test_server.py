@@ -0,0 +1,47 @@
+# Copyright (c) 2026 Dedalus Labs, Inc. and its contributors
+# SPDX-License-Identifier: MIT
+
+"""Tests for the MCP server entrypoint."""
+
+import io
+import logging
+
+import pytest
+from dedalus_mcp.utils import get_logger
+from dedalus_mcp.utils.logger import DedalusMCPHandler
+
+import server
+
+
+@pytest.fixture
+def log_stream():
+    """Give the root logger a single dedalus_mcp handler writing to a buffer."""
+    root = logging.getLogger()
+    saved = list(root.handlers)
+    stream = io.StringIO()
+    root.handlers = [DedalusMCPHandler(stream)]
+    yield stream
+    root.handlers = saved
+
+
+def test_log_listener_survives_dedalus_get_logger(log_stream):
+    root = logging.getLogger()
+    listener = server._start_log_listener()
+    try:
+        handlers = list(root.handlers)
+        assert not any(handler.stream is log_stream for handler in handlers)
+
+        get_logger("dedalus_mcp.test")
+        assert root.handlers == handlers
+    finally:
+        listener.stop()
+
+
+def test_log_listener_emits_records_once(log_stream):
+    listener = server._start_log_listener()
+    try:
+        get_logger("dedalus_mcp.test")
+        logging.getLogger("slack").warning("Token refresh failed: %s", "invalid_auth")
+    finally:
+        listener.stop()
+    assert log_stream.getvalue().count("Token refresh failed: invalid_auth") == 1
@@ -0,0 +1,274 @@
+# Copyright (c) 2026 Dedalus Labs, Inc. and its contributors
+# SPDX-License-Identifier: MIT
+
+"""Tests for the Slack API request helpers."""
+
+import asyncio
+import inspect
+import json
+
+import httpx
+import pytest
+from dedalus_mcp import extract_tool_spec
+
+import slack
+
+
+async def test_paginate_follows_cursors(fake_slack):
+    pages = {"": ("a", ["U0"]), "a": ("b", ["U1"]), "b": ("", ["U2"])}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        next_cursor, members = pages[json.loads(request.content).get("cursor", "")]
+        return httpx.Response(200, json={"ok": True, "members": members, "response_metadata": {"next_cursor": next_cursor}})
+
+    fake_slack.handler = handler
+    data = await slack._paginate("users.list", {}, "members")
+    assert data == {"ok": True, "members": ["U0", "U1", "U2"], "response_metadata": {"next_cursor": ""}}
+
+
+async def test_paginate_fetches_at_least_one_page(fake_slack):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"ok": True, "members": ["U0"], "response_metadata": {"next_cursor": "a"}})
+
+    fake_slack.handler = handler
+    data = await slack._paginate("users.list", {}, "members", max_pages=0)
+    assert data["members"] == ["U0"]
+    assert data["response_metadata"]["next_cursor"] == "a"
+
+
+async def test_paginate_keeps_items_before_failed_page(fake_slack):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if json.loads(request.content).get("cursor"):
+            return httpx.Response(200, json={"ok": False, "error": "internal_error"})
+        return httpx.Response(200, json={"ok": True, "members": ["U0"], "response_metadata": {"next_cursor": "a"}})
+
+    fake_slack.handler = handler
+    data = await slack._paginate("users.list", {}, "members")
+    assert data == {"ok": False, "error": "internal_error", "members": ["U0"], "response_metadata": {"next_cursor": "a"}}
+
+
+async def test_channel_queue_survives_cancelled_caller(fake_slack):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.3)
+        return httpx.Response(200, json={"ok": True, "text": json.loads(request.content)["text"]})
+
+    fake_slack.handler = handler
+    first = asyncio.create_task(slack._post_to_channel("chat.postMessage", {"channel": "C1", "text": "one"}))
+    await asyncio.sleep(0.1)
+    first.cancel()
+
+    result = await asyncio.wait_for(slack._post_to_channel("chat.postMessage", {"channel": "C1", "text": "two"}), 2)
+    assert json.loads(result[0].text) == {"ok": True, "text": "two"}
+    assert fake_slack.calls == ["chat.postMessage", "chat.postMessage"]
+
+
+async def test_channel_queue_paces_writes_per_channel(fake_slack):
+    sent: list[tuple[str, str]] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        sent.append((body["channel"], body["text"]))
+        return httpx.Response(200, json={"ok": True})
+
+    fake_slack.handler = handler
+    await asyncio.gather(
+        *(slack._post_to_channel("chat.postMessage", {"channel": c, "text": t}) for c, t in ["A1", "A2", "B1"])
+    )
+    assert [t for c, t in sent if c == "A"] == ["1", "2"]
+    assert sent.index(("B", "1")) < sent.index(("A", "2"))
+    await asyncio.sleep(0.05)
+    assert slack._channel_queues == {}
+
+
+async def test_acquire_allows_burst_then_waits(fake_slack, monkeypatch):
+    monkeypatch.setattr(slack, "_METHOD_RATES", {"test.method": 600})  # 10 per second
+    loop = asyncio.get_running_loop()
+
+    start = loop.time()
+    for _ in range(slack._BUCKET_BURST):
+        await slack._acquire("test.method")
+    assert loop.time() - start < 0.05
+
+    await slack._acquire("test.method")
+    assert loop.time() - start >= 0.08
+
+
+async def test_rate_limited_response_is_retried(fake_slack):
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "0"}, json={"ok": False, "error": "ratelimited"}),
+        httpx.Response(200, json={"ok": True}),
+    ]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    fake_slack.handler = handler
+    assert await slack._request("POST", "chat.update", {"channel": "C1"}) == {"ok": True}
+    assert fake_slack.calls == ["chat.update", "chat.update"]
+
+
+async def test_identical_reads_share_one_request(fake_slack):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"ok": True, "members": []})
+
+    fake_slack.handler = handler
+    results = await asyncio.gather(*(slack._request("POST", "conversations.members", {"channel": "C1"}) for _ in range(5)))
+    assert results == [{"ok": True, "members": []}] * 5
+    assert fake_slack.calls == ["conversations.members"]
+
+
+async def test_identical_writes_are_not_coalesced(fake_slack):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"ok": True})
+
+    fake_slack.handler = handler
+    await asyncio.gather(*(slack._request("POST", "chat.update", {"channel": "C1", "ts": "1"}) for _ in range(2)))
+    assert fake_slack.calls == ["chat.update", "chat.update"]
+
+
+async def test_cached_read_skips_network_until_invalidated(fake_slack):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"ok": True})
+
+    fake_slack.handler = handler
+    await slack._request("POST", "conversations.info", {"channel": "C1"})
+    await slack._request("POST", "conversations.info", {"channel": "C1"})
+    assert fake_slack.calls == ["conversations.info"]
+
+    await slack._request("POST", "conversations.join", {"channel": "C1"})
+    await slack._request("POST", "conversations.info", {"channel": "C1"})
+    assert fake_slack.calls == ["conversations.info", "conversations.join", "conversations.info"]
+
+
+async def test_error_responses_are_not_cached(fake_slack):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"ok": False, "error": "user_not_found"})
+
+    fake_slack.handler = handler
+    await slack._request("POST", "users.info", {"user": "U1"})
+    await slack._request("POST", "users.info", {"user": "U1"})
+    assert fake_slack.calls == ["users.info", "users.info"]
+
+
+async def test_reads_are_retried_on_server_errors(fake_slack):
+    responses = [httpx.Response(503), httpx.Response(200, json={"ok": True})]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    fake_slack.handler = handler
+    assert await slack._request("POST", "users.info", {"user": "U1"}) == {"ok": True}
+    assert fake_slack.calls == ["users.info", "users.info"]
+
+
+async def test_writes_are_retried_only_on_connect_errors(fake_slack):
+    attempts = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise httpx.ConnectError("connection refused", request=request)
+        raise httpx.ReadError("connection reset", request=request)
+
+    fake_slack.handler = handler
+    with pytest.raises(httpx.ReadError):
+        await slack._request("POST", "chat.update", {"channel": "C1", "ts": "1"})
+    assert attempts == 2
+
+
+async def test_read_only_methods_match_tool_annotations(fake_slack):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"ok": True})
+
+    fake_slack.handler = handler
+    read_endpoints: set[str] = set()
+    write_endpoints: set[str] = set()
+    for fn in slack.slack_tools:
+        spec = extract_tool_spec(fn)
+        required = {
+            name: "X"
+            for name, param in inspect.signature(fn).parameters.items()
+            if param.default is inspect.Parameter.empty
+        }
+        fake_slack.calls.clear()
+        await fn(**required)
+        assert fake_slack.calls, spec.name
+        (read_endpoints if spec.annotations.readOnlyHint else write_endpoints).update(fake_slack.calls)
+
+    assert read_endpoints == slack._READ_ONLY_METHODS
+    assert not write_endpoints & slack._READ_ONLY_METHODS
+
+
+async def test_expired_cache_entries_are_dropped(fake_slack, monkeypatch):
+    monkeypatch.setattr(slack, "_CACHE_TTLS", {"users.info": 0.01})
+    responses = [httpx.Response(200, json={"ok": True}), httpx.Response(200, json={"ok": False, "error": "fatal_error"})]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    fake_slack.handler = handler
+    await slack._request("POST", "users.info", {"user": "U1"})
+    assert len(slack._cache) == 1
+    await asyncio.sleep(0.02)
+    await slack._request("POST", "users.info", {"user": "U1"})
+    assert len(slack._cache) == 0
+
+
+async def test_cache_evicts_least_recently_used(fake_slack, monkeypatch):
+    monkeypatch.setattr(slack, "_CACHE_MAX_ENTRIES", 2)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"ok": True})
+
+    fake_slack.handler = handler
+    for user in ["U1", "U2", "U1", "U3"]:
+        await slack._request("POST", "users.info", {"user": user})
+    assert [key[2] for key in slack._cache] == [(("user", "U1"),), (("user", "U3"),)]
+    assert fake_slack.calls == ["users.info"] * 3
+
+
+async def test_concurrent_expired_token_refreshes_once(fake_slack, monkeypatch, tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text("OTHER=1\nSLACK_TOKEN=xoxe.xoxp-old\nSLACK_REFRESH_TOKEN=xoxe-r0\nMORE=2\n")
+    monkeypatch.setattr(slack, "ENV_FILE", env_file)
+    monkeypatch.setattr(slack, "_METHOD_RATES", {"users.info": 60_000})
+    slack._set_tokens("xoxe.xoxp-old", "xoxe-r0")
+    rotations = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal rotations
+        if request.url.path.endswith("tooling.tokens.rotate"):
+            rotations += 1
+            await asyncio.sleep(0.01)
+            return httpx.Response(
+                200, json={"ok": True, "token": f"xoxe.xoxp-new{rotations}", "refresh_token": f"xoxe-r{rotations}"}
+            )
+        if request.headers["Authorization"] == "Bearer xoxe.xoxp-old":
+            return httpx.Response(200, json={"ok": False, "error": "token_expired"})
+        return httpx.Response(200, json={"ok": True})
+
+    fake_slack.handler = handler
+    results = await asyncio.gather(*(slack._request("POST", "users.info", {"user": f"U{i}"}) for i in range(20)))
+
+    assert results == [{"ok": True}] * 20
+    assert rotations == 1
+    assert slack._ACCESS_TOKEN == "xoxe.xoxp-new1"
+    assert env_file.read_text() == "OTHER=1\nSLACK_TOKEN=xoxe.xoxp-new1\nSLACK_REFRESH_TOKEN=xoxe-r1\nMORE=2\n"
+
+
+async def test_tools_send_required_args_even_when_empty(fake_slack):
+    bodies: list[dict] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json={"ok": True})
+
+    fake_slack.handler = handler
+    await slack.slack_search_messages(query="q", sort="", sort_dir="")
+    await slack.slack_reminders_add(text="", time="in 5 minutes")
+    assert bodies == [
+        {"query": "q", "count": 20, "sort": "", "sort_dir": ""},
+        {"text": "", "time": "in 5 minutes"},
+    ]